@@ -43,11 +43,11 @@ class AddWatchlistForm(FlaskForm):
 
     def validate_name(self, name: StringField) -> None:
         input_name = name.data
-        watchlist = WatchlistMgr.get_first_item(filters=[
+        watchlist_exists = WatchlistMgr.has_items(filters=[
             Watchlist.user_id == current_user.id,  # type: ignore
             Watchlist.name == input_name,
         ])
-        if watchlist is not None:
+        if watchlist_exists:
             raise ValidationError(
                 f"The watchlist '{input_name}' already exists.")
 
@@ -58,17 +58,17 @@ class SelectWatchlistForm(FlaskForm):
         validators=[
             InputRequired(),
             Length(min=3, max=25)
-        ]
+        ],
+        validate_choice=False,  # Checked by validate_name
     )
     submit = SubmitField("Select")
 
     def validate_name(self, name: SelectField) -> None:
+        # The choices are loaded from the user's watchlists by the view,
+        # so there's no need to query the database again.
         input_name = name.data
-        watchlist = WatchlistMgr.get_first_item(filters=[
-            Watchlist.user_id == current_user.id,  # type: ignore
-            Watchlist.name == input_name,
-        ])
-        if watchlist is None:
+        watch_names = [value for value, _ in (name.choices or [])]
+        if input_name not in watch_names:
             raise ValidationError(
                 f"The watchlist '{input_name}' doesn't exist."
             )
@@ -1,7 +1,9 @@
 import datetime as dt
-from typing import Any, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import expression, func, case
 from sqlalchemy.sql.elements import BinaryExpression
@@ -64,6 +66,9 @@ class Price(db.Model):
 
 class Watchlist(db.Model):
     __tablename__ = "watchlists"
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "name", name="uq_userid_name"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(25), nullable=False)
     user_id = db.Column(
@@ -83,6 +88,10 @@ class Watchlist(db.Model):
 
 class WatchlistItem(db.Model):
     __tablename__ = "watchlist_items"
+    __table_args__ = (
+        db.Index("idx_watchlistid_islasttrade", 'watchlist_id', 'is_last_trade'),
+        db.Index("idx_ticker", 'ticker'),
+    )
     id = db.Column(db.Integer, primary_key=True, index=True)
     ticker = db.Column(db.String(20), nullable=False)
     quantity = db.Column(db.Integer, nullable=False)
@@ -107,6 +116,45 @@ class WatchlistItem(db.Model):
 
 
 class SecurityMgr:
+    default_entities = [
+        Security.name,
+        Security.ticker,
+        Security.exchange,
+        Security.currency,
+        Security.country,
+        Security.isin,
+    ]
+    default_orderby = [Security.ticker]
+
+    # The securities only change when they're loaded from the APIs,
+    # so the full listing is kept in memory for up to an hour.
+    # The loaders run in the 'init_db' CLI process, so the timeout is
+    # the only way the web processes pick up their changes; an empty
+    # listing isn't cached, so the first load shows up right away.
+    cache_timeout = 3600
+    _all_items_cache: Optional[Tuple[float, List[Row]]] = None
+
+    @classmethod
+    def get_all_items(cls) -> List[Row]:
+        now = time.monotonic()
+        if (
+            cls._all_items_cache is None or
+            now - cls._all_items_cache[0] > cls.cache_timeout
+        ):
+            query = (
+                select(*cls.default_entities)
+                .order_by(*cls.default_orderby)
+            )
+            items = list(db.session.execute(query).all())
+            if not items:
+                return items
+            cls._all_items_cache = (now, items)
+        return cls._all_items_cache[1]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._all_items_cache = None
+
     @classmethod
     def get_items(
         cls,
@@ -115,16 +163,9 @@ class SecurityMgr:
         orderby: Optional[List[Any]] = None,
     ) -> pd.DataFrame:
         if not entities:
-            entities = [
-                Security.name,
-                Security.ticker,
-                Security.exchange,
-                Security.currency,
-                Security.country,
-                Security.isin,
-            ]
+            entities = cls.default_entities
         if not orderby:
-            orderby = [Security.ticker]
+            orderby = cls.default_orderby
         query = (
             db
             .session
@@ -181,6 +222,24 @@ class PriceMgr:
         )
         return query_to_df(query)
 
+    @classmethod
+    def get_distinct_items(
+        cls,
+        filters: List[BinaryExpression],
+        entities: List[Any],
+        orderby: Optional[List[Any]] = None,
+    ) -> pd.DataFrame:
+        if not orderby:
+            orderby = entities
+        query = (
+            cls
+            ._base_query(filters)
+            .with_entities(*entities)
+            .distinct()
+            .order_by(*orderby)
+        )
+        return query_to_df(query)
+
 
 class WatchlistMgr:
     @classmethod
@@ -198,6 +257,43 @@ class WatchlistMgr:
         item = cls._base_query(filters).first()
         return item
 
+    @classmethod
+    def get_first_id(cls, filters: List[BinaryExpression]) -> Optional[int]:
+        item_id = (
+            cls
+            ._base_query(filters)
+            .with_entities(Watchlist.id)
+            .limit(1)
+            .scalar()
+        )
+        return item_id
+
+    @classmethod
+    def delete_items(cls, filters: List[BinaryExpression]) -> int:
+        deleted = cls._base_query(filters).delete(synchronize_session=False)
+        return deleted
+
+    @classmethod
+    def get_names(
+        cls,
+        filters: List[BinaryExpression],
+        orderby: Optional[List[Any]] = None,
+    ) -> List[str]:
+        if not orderby:
+            orderby = [Watchlist.id]
+        query = (
+            cls
+            ._base_query(filters)
+            .with_entities(Watchlist.name)
+            .order_by(*orderby)
+        )
+        return [name for (name,) in query]
+
+    @classmethod
+    def has_items(cls, filters: List[BinaryExpression]) -> bool:
+        query = cls._base_query(filters).with_entities(Watchlist.id)
+        return bool(db.session.query(query.exists()).scalar())
+
     @classmethod
     def get_items(
         cls,
@@ -264,6 +360,36 @@ class WatchlistItemMgr:
         )
         return query_to_df(query)
 
+    @classmethod
+    def update_items(
+        cls,
+        filters: List[BinaryExpression],
+        values: Dict[str, Any],
+    ) -> int:
+        # Query.update() doesn't support joins, so the filters
+        # can only reference the WatchlistItem table.
+        updated = (
+            db
+            .session
+            .query(WatchlistItem)
+            .filter(*filters)
+            .update(values, synchronize_session=False)
+        )
+        return updated
+
+    @classmethod
+    def delete_items(cls, filters: List[BinaryExpression]) -> int:
+        # Query.delete() doesn't support joins, so the filters
+        # can only reference the WatchlistItem table.
+        deleted = (
+            db
+            .session
+            .query(WatchlistItem)
+            .filter(*filters)
+            .delete(synchronize_session=False)
+        )
+        return deleted
+
     @classmethod
     def get_distinct_items(
         cls,
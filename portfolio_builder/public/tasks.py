@@ -1,7 +1,8 @@
 import datetime as dt
 import logging
+import threading
 from io import StringIO
-from typing import Dict, List
+from typing import Dict, List, Set
 
 import pandas as pd
 import requests
@@ -11,7 +12,7 @@ from tiingo import TiingoClient
 
 from portfolio_builder import db, scheduler
 from portfolio_builder.public.models import (
-    Price, Security, WatchlistItem,
+    Security, WatchlistItem,
     SecurityMgr, PriceMgr, WatchlistItemMgr
 )
 
@@ -120,6 +121,7 @@ def load_securities_csv() -> None:
         if_exists="append",
         index=False
     )
+    SecurityMgr.clear_cache()
 
 
 def load_securities() -> None:
@@ -148,6 +150,7 @@ def load_securities() -> None:
         if_exists="append",
         index=False
     )
+    SecurityMgr.clear_cache()
     return
 
 
@@ -196,13 +199,67 @@ def load_prices_all_tickers() -> None:
                 load_prices(all_tickers, start_date, end_date)
 
 
-def load_prices_ticker(ticker: str) -> None:
+def load_prices_tickers(tickers: List[str]) -> None:
     with scheduler.app.app_context():  # type: ignore
-        price_obj = PriceMgr.get_first_item(
-            filters=[Security.ticker == ticker],
-            orderby = [Price.date.desc()]
+        df_loaded_tickers = PriceMgr.get_distinct_items(
+            filters=[Security.ticker.in_(tickers)],
+            entities=[Security.ticker],
+            orderby=[Security.ticker],
         )
-        if price_obj is None:
+        loaded_tickers = set(df_loaded_tickers.get('ticker', []))
+        new_tickers = [
+            ticker
+            for ticker in tickers
+            if ticker not in loaded_tickers
+        ]
+        if new_tickers:
             end_date = dt.date.today() - dt.timedelta(days=1)
             start_date = end_date - dt.timedelta(days=100)
-            load_prices([ticker], start_date, end_date)
+            try:
+                load_prices(new_tickers, start_date, end_date)
+            except Exception as e:
+                # A single failing ticker aborts the whole batch,
+                # so retry them one by one to only lose that one.
+                logging.warning(f"Loading the prices of {new_tickers} failed: {e}")
+                for ticker in new_tickers:
+                    try:
+                        load_prices([ticker], start_date, end_date)
+                    except Exception as e:
+                        logging.error(
+                            f"Loading the prices of '{ticker}' failed: {e}"
+                        )
+
+
+# Tickers added to watchlists whose prices haven't been loaded yet.
+# They're loaded in batches by 'load_prices_pending_tickers', so that
+# a burst of additions shares one lookup of the tickers that already
+# have prices and one insert of the new prices. Tiingo is still
+# requested once per ticker.
+pending_tickers: Set[str] = set()
+pending_tickers_lock = threading.Lock()
+PENDING_TICKERS_DELAY = 5  # seconds
+
+
+def queue_prices_ticker(ticker: str) -> None:
+    with pending_tickers_lock:
+        pending_tickers.add(ticker)
+        if scheduler.get_job('load_prices_pending_tickers') is None:
+            scheduler.add_job(
+                id='load_prices_pending_tickers',
+                func=load_prices_pending_tickers,
+                trigger='date',
+                run_date=(
+                    dt.datetime.now() +
+                    dt.timedelta(seconds=PENDING_TICKERS_DELAY)
+                ),
+                replace_existing=True,
+                misfire_grace_time=None,
+            )  # task executes only once, after the tickers of a burst are queued.
+
+
+def load_prices_pending_tickers() -> None:
+    with pending_tickers_lock:
+        tickers = sorted(pending_tickers)
+        pending_tickers.clear()
+    if tickers:
+        load_prices_tickers(tickers)
@@ -242,10 +242,9 @@ def calc_last_portf_position(
 @bp.route('/', methods=['GET', 'POST'])
 @login_required
 def index() -> str:
-    df_watch_names = WatchlistMgr.get_items(filters=[
+    watch_names = WatchlistMgr.get_names(filters=[
         Watchlist.user_id == current_user.id  # type: ignore
     ])
-    watch_names = df_watch_names.loc[:, 'name'].to_list()
     if request.method == 'POST':
         curr_watch_name = request.form.get('watchlist_group_selection', '')
     else:
@@ -1,11 +1,17 @@
 import datetime as dt
+import functools
+from typing import List
 
-from flask import Blueprint, flash, redirect, render_template, url_for
+from flask import (
+    Blueprint, flash, redirect, render_template, request, url_for
+)
 from werkzeug.wrappers.response import Response
 from flask_login import current_user, login_required
 from flask_wtf import FlaskForm
+from sqlalchemy import Select, select
+from sqlalchemy.exc import IntegrityError
 
-from portfolio_builder import db, scheduler
+from portfolio_builder import db
 from portfolio_builder.public.forms import (
     AddWatchlistForm, SelectWatchlistForm,
     AddItemForm, UpdateItemForm
@@ -14,7 +20,7 @@ from portfolio_builder.public.models import (
     Watchlist, WatchlistItem,
     SecurityMgr, WatchlistMgr, WatchlistItemMgr
 )
-from portfolio_builder.public.tasks import load_prices_ticker
+from portfolio_builder.public.tasks import queue_prices_ticker
 
 
 bp = Blueprint("watchlist", __name__, url_prefix="/watchlist")
@@ -22,12 +28,45 @@ bp = Blueprint("watchlist", __name__, url_prefix="/watchlist")
 
 def flash_errors(form: FlaskForm, category="warning"):
     """Flash all errors for a form."""
+    labels = {field.short_name: field.label.text for field in form}
     for field, errors in form.errors.items():
+        label = labels.get(field, field)
         for error in errors:
-            flash(
-                f"{getattr(form, field).label.text} - {error}",  # type: ignore
-                category
-            )
+            flash(f"{label} - {error}", category)
+
+
+@functools.lru_cache(maxsize=8)
+def get_index_url(script_root: str) -> str:
+    # The URL only depends on where the app is mounted
+    return url_for('watchlist.index')
+
+
+def redirect_to_index() -> Response:
+    """Redirects to the watchlist index page."""
+    return redirect(get_index_url(request.script_root))
+
+
+def get_watch_names() -> List[str]:
+    """Gets the names of the current user's watchlists."""
+    watch_names = WatchlistMgr.get_names(
+        filters=[Watchlist.user_id == current_user.id],  # type: ignore
+    )
+    return watch_names
+
+
+def select_watchlist_ids(watch_name: str) -> Select:
+    """
+    Builds a subquery selecting the ID of the current user's watchlist
+    named `watch_name`, to filter or fill the watchlist items' foreign key.
+    """
+    query = (
+        select(Watchlist.id)
+        .where(
+            Watchlist.user_id == current_user.id,  # type: ignore
+            Watchlist.name == watch_name,
+        )
+    )
+    return query
 
 
 @bp.route("/", methods=['GET', 'POST'])
@@ -39,16 +78,18 @@ def index() -> str:
     Returns:
         str: A rendered HTML template with the necessary data.
     """
-    df_watch_names = WatchlistMgr.get_items(
-        filters=[Watchlist.user_id == current_user.id],  # type: ignore
-    )
-    watch_names = df_watch_names.loc[:, 'name'].to_list()
+    watch_names = get_watch_names()
     add_watch_form = AddWatchlistForm()
+    if not watch_names:
+        # Without watchlists, the page only shows the form to create one
+        return render_template(
+            "public/watchlist.html",
+            add_watch_form=add_watch_form,
+            curr_watch_name='',
+            watch_names=watch_names,
+        )
     select_watch_form = SelectWatchlistForm()
-    select_watch_form.name.choices = [
-        (item, item)
-        for item in watch_names
-    ]
+    select_watch_form.name.choices = [(name, name) for name in watch_names]
     if select_watch_form.validate_on_submit():
         curr_watch_name = select_watch_form.name.data  # Current watchlist name
     else:
@@ -64,11 +105,7 @@ def index() -> str:
         ])
         .itertuples(index=False)
     )
-    securities = list(
-        SecurityMgr
-        .get_items(filters=[db.literal(True)])
-        .itertuples(index=False)
-    )
+    securities = SecurityMgr.get_all_items()
     return render_template(
         "public/watchlist.html",
         select_watch_form=select_watch_form,
@@ -99,11 +136,23 @@ def add_watchlist() -> Response:
             name=watchlist_name,
         )
         db.session.add(new_watchlist)
-        db.session.commit()
-        flash(f"The watchlist '{watchlist_name}' has been added.")
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            watchlist_exists = WatchlistMgr.has_items(filters=[
+                Watchlist.user_id == current_user.id,  # type: ignore
+                Watchlist.name == watchlist_name,
+            ])
+            if not watchlist_exists:
+                raise
+            # Another request added the same watchlist after validation
+            flash(f"The watchlist '{watchlist_name}' already exists.")
+        else:
+            flash(f"The watchlist '{watchlist_name}' has been added.")
     elif form.errors:
         flash_errors(form)
-    return redirect(url_for('watchlist.index'))
+    return redirect_to_index()
 
 
 @bp.route('/delete_watchlist', methods=['POST'])
@@ -114,29 +163,23 @@ def delete_watchlist() -> Response:
 
     :return: A redirect response to the 'watchlist.index' route.
     """
-    df_watch_names = WatchlistMgr.get_items(
-        filters=[Watchlist.user_id == current_user.id],  # type: ignore
-    )
-    watch_names = df_watch_names.loc[:, 'name'].to_list()
+    watch_names = get_watch_names()
     form = SelectWatchlistForm()
-    form.name.choices = [
-        (item, item)
-        for item in watch_names
-    ]
+    form.name.choices = [(name, name) for name in watch_names]
     if form.validate_on_submit():
         watch_name = form.name.data
-        watchlist = WatchlistMgr.get_first_item(
-            filters=[Watchlist.name == watch_name]
-        )
-        if watchlist is None:
+        deleted = WatchlistMgr.delete_items(filters=[
+            Watchlist.user_id == current_user.id,  # type: ignore
+            Watchlist.name == watch_name,
+        ])
+        if not deleted:
             flash(f"The watchlist '{watch_name}' does not exist.")
         else:
-            db.session.delete(watchlist)
             db.session.commit()
             flash(f"The watchlist '{watch_name}' has been deleted.")
     elif form.errors:
         flash_errors(form)
-    return redirect(url_for('watchlist.index'))
+    return redirect_to_index()
 
 
 @bp.route('/<watch_name>/add', methods=['POST'])
@@ -153,34 +196,32 @@ def add(watch_name: str) -> Response:
     """
     form = AddItemForm()
     if form.validate_on_submit():
-        watchlist = WatchlistMgr.get_first_item(
-            filters=[Watchlist.name == watch_name]
-        )
-        if not watchlist:
+        watchlist_id = WatchlistMgr.get_first_id(filters=[
+            Watchlist.user_id == current_user.id,  # type: ignore
+            Watchlist.name == watch_name,
+        ])
+        if not watchlist_id:
             flash(f"The watchlist '{watch_name}' does not exist.")
         else:
+            ticker = form.ticker.data
             item = WatchlistItem(
-                ticker=form.ticker.data,
+                ticker=ticker,
                 quantity=form.quantity.data,
                 price=form.price.data,
                 side=form.side.data,
                 trade_date=form.trade_date.data,
                 comments=form.comments.data,
-                watchlist_id=watchlist.id
+                watchlist_id=watchlist_id
             )
             db.session.add(item)
             db.session.commit()
             flash(
-                f"The ticker '{item.ticker}' has been added to the watchlist."
+                f"The ticker '{ticker}' has been added to the watchlist."
             )
-            scheduler.add_job(
-                id='add_db_last100day_prices',
-                func=load_prices_ticker,
-                args=[item.ticker],
-            )  # task executes only once, immediately.
+            queue_prices_ticker(ticker)  # prices are loaded in the next batch.
     elif form.errors:
         flash_errors(form)
-    return redirect(url_for("watchlist.index"))
+    return redirect_to_index()
 
 
 @bp.route('/<watch_name>/<ticker>/update', methods=['POST'])
@@ -199,16 +240,18 @@ def update(watch_name: str, ticker: str) -> Response:
     """
     form = UpdateItemForm()
     if form.validate_on_submit():
-        last_item = WatchlistItemMgr.get_first_item(filters=[
-            Watchlist.user_id == current_user.id,  # type: ignore
-            Watchlist.name == watch_name,
-            WatchlistItem.ticker == ticker,
-            WatchlistItem.is_last_trade == True,
-        ])
-        if not last_item:
+        watchlist_ids = select_watchlist_ids(watch_name)
+        updated = WatchlistItemMgr.update_items(
+            filters=[
+                WatchlistItem.watchlist_id.in_(watchlist_ids),
+                WatchlistItem.ticker == ticker,
+                WatchlistItem.is_last_trade == True,
+            ],
+            values={'is_last_trade': False},
+        )
+        if not updated:
             flash(f"There are no items of ticker '{ticker}' to update.")
         else:
-            last_item.is_last_trade = False
             new_item = WatchlistItem(
                 ticker=form.ticker.data,
                 quantity=form.quantity.data,
@@ -216,14 +259,15 @@ def update(watch_name: str, ticker: str) -> Response:
                 side=form.side.data,
                 trade_date=form.trade_date.data,
                 comments=form.comments.data,
-                watchlist_id=last_item.watchlist_id
+                # Resolved by the INSERT itself
+                watchlist_id=watchlist_ids.scalar_subquery()
             )
-            db.session.add_all([last_item, new_item])
+            db.session.add(new_item)
             db.session.commit()
-            flash(f"The ticker '{new_item.ticker}' has been updated.")
+            flash(f"The ticker '{form.ticker.data}' has been updated.")
     elif form.errors:
         flash_errors(form)
-    return redirect(url_for("watchlist.index"))
+    return redirect_to_index()
 
 
 @bp.route('/<watch_name>/<ticker>/delete', methods=['POST'])
@@ -239,31 +283,20 @@ def delete(watch_name: str, ticker: str) -> Response:
     Returns:
         Response: Redirects the user to the watchlist index page.
     """
-    df_ids = WatchlistItemMgr.get_items(
-        filters=[
-            Watchlist.user_id == current_user.id,  # type: ignore
-            Watchlist.name == watch_name,
-            WatchlistItem.ticker == ticker,
-        ],
-        entities=[WatchlistItem.id]
-    )
-    if df_ids.empty:
+    watchlist_ids = select_watchlist_ids(watch_name)
+    deleted = WatchlistItemMgr.delete_items(filters=[
+        WatchlistItem.watchlist_id.in_(watchlist_ids),
+        WatchlistItem.ticker == ticker,
+    ])
+    if not deleted:
         flash(
             f"An error occurred while trying to delete " +
             f"the items of ticker '{ticker}' from watchlist '{watch_name}'."
         )
     else:
-        IDs = df_ids.loc[:, 'id'].to_list()
-        _ = (
-            db
-            .session
-            .query(WatchlistItem)
-            .filter(WatchlistItem.id.in_(IDs))
-            .delete()
-        )
         db.session.commit()
         flash(
             f"The items of ticker '{ticker}' have been deleted " +
-            f"from watchlist '{watch_name}'."
+            f"from watchlist '{watch_name}' ({deleted} in total)."
         )
-    return redirect(url_for('watchlist.index'))
+    return redirect_to_index()
@@ -39,11 +39,21 @@ class TestSettings(Settings):
 
 
 class ProdSettings(Settings):
-    DB_URL = f'mysql://{db_user}:{db_passwd}@{db_host}'
+    DB_URL = f'mysql+mysqldb://{db_user}:{db_passwd}@{db_host}'
     SQLALCHEMY_DATABASE_URI = f'{DB_URL}/main'
     SQLALCHEMY_BINDS = {
         "Main": (f'{DB_URL}/main'),
     }
+    # Applied to every engine, including the binds. With the default
+    # engine and the "Main" bind, each process can open up to
+    # 2 * (5 + 10) = 30 connections, so keep the number of workers
+    # times 30 below MySQL's max_connections (151 by default).
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
 
     # Flask-APScheduler Configurations
     SCHEDULER_API_ENABLED = True
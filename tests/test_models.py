@@ -47,11 +47,15 @@ def prices(db, securities):
 
 @pytest.fixture(scope='function')
 def watchlists(db):
-    watchlists = [
-        Watchlist(name="Technology", user_id=1),
-        Watchlist(name="Real Estate", user_id=1),
-        Watchlist(name="Oil and Gas", user_id=1),
-    ]
+    # Watchlist names are unique per user, so reuse
+    # the ones left over by previous tests.
+    watchlists = []
+    for name in ["Technology", "Real Estate", "Oil and Gas"]:
+        watchlist = (
+            db.session.query(Watchlist).filter_by(name=name, user_id=1).first() or
+            Watchlist(name=name, user_id=1)
+        )
+        watchlists.append(watchlist)
     db.session.add_all(watchlists)
     db.session.commit()
     yield watchlists
@@ -293,6 +297,16 @@ class TestWatchlist:
             db.session.add(watchlist)
             db.session.commit()
 
+    def test_create_watchlist_with_duplicate_name(self, db, db_teardown):
+        watchlist = Watchlist(name="My Watchlist", user_id=1)
+        db.session.add(watchlist)
+        db.session.commit()
+        with pytest.raises(IntegrityError):
+            duplicate = Watchlist(name="My Watchlist", user_id=1)
+            db.session.add(duplicate)
+            db.session.commit()
+        db.session.rollback()
+
 
 class TestWatchlistItem:
 
@@ -552,6 +566,70 @@ class TestGetFirstWatchlist:
             WatchlistMgr.get_first_item(filters=[Watchlist.invalid_column == "Invalid"])
 
 
+class TestGetFirstWatchlistId:
+
+    def test_returns_id_valid_filter(self, watchlists, db_teardown):
+        # Returns the ID of the Watchlist matching the filter
+        watchlist = random.choice(watchlists)
+        result = WatchlistMgr.get_first_id(filters=[Watchlist.name == watchlist.name])
+        assert result == watchlist.id
+
+    def test_returns_none_no_match(self, db_teardown):
+        # Returns None when no Watchlist matches the filter
+        result = WatchlistMgr.get_first_id(filters=[Watchlist.name == "Nonexistent Watchlist"])
+        assert result is None
+
+
+class TestDeleteWatchlists:
+
+    def test_deletes_matching_watchlist(self, db, watchlists, db_teardown):
+        # Deletes only the Watchlist matching the filters
+        # and returns how many were deleted
+        name = random.choice(watchlists).name
+        len_watchlists_before = db.session.query(Watchlist).count()
+        result = WatchlistMgr.delete_items(filters=[Watchlist.name == name])
+        db.session.commit()
+        assert result == 1
+        assert db.session.query(Watchlist).count() == len_watchlists_before - 1
+        assert db.session.query(Watchlist).filter_by(name=name).first() is None
+
+    def test_returns_zero_no_match(self, db, watchlists, db_teardown):
+        # Returns 0 and deletes nothing when no Watchlist matches
+        len_watchlists_before = db.session.query(Watchlist).count()
+        result = WatchlistMgr.delete_items(filters=[Watchlist.name == "Nonexistent Watchlist"])
+        db.session.commit()
+        assert result == 0
+        assert db.session.query(Watchlist).count() == len_watchlists_before
+
+
+class TestGetWatchlistNames:
+
+    def test_returns_names_matching_filter(self, watchlists, db_teardown):
+        # Returns a flat list with the names of the matching Watchlists,
+        # in the order they were created
+        result = WatchlistMgr.get_names(filters=[Watchlist.user_id == 1])
+        assert result == [watchlist.name for watchlist in watchlists]
+
+    def test_returns_empty_list_no_match(self, db_teardown):
+        # Returns an empty list when no Watchlist matches the filter
+        result = WatchlistMgr.get_names(filters=[Watchlist.name == "Nonexistent Watchlist"])
+        assert result == []
+
+
+class TestHasWatchlists:
+
+    def test_returns_true_valid_filter(self, watchlists, db_teardown):
+        # Returns True when a Watchlist matches the filter
+        watchlist = random.choice(watchlists)
+        result = WatchlistMgr.has_items(filters=[Watchlist.name == watchlist.name])
+        assert result is True
+
+    def test_returns_false_no_match(self, db_teardown):
+        # Returns False when no Watchlist matches the filter
+        result = WatchlistMgr.has_items(filters=[Watchlist.name == "Nonexistent Watchlist"])
+        assert result is False
+
+
 class TestGetFirstWatchItem:
 
     def test_returns_first_valid_ticker_filter(self, watch_items, db_teardown):
@@ -596,6 +674,57 @@ class TestGetFirstWatchItem:
         assert pattern in result.ticker
 
 
+class TestUpdateWatchItems:
+
+    def test_updates_matching_items(self, db, watch_items, db_teardown):
+        # Updates only the WatchlistItems matching the filters
+        # and returns how many were updated
+        ticker = random.choice(watch_items).ticker
+        expected = (
+            db.session.query(WatchlistItem)
+            .filter_by(ticker=ticker, is_last_trade=True)
+            .count()
+        )
+        result = WatchlistItemMgr.update_items(
+            filters=[
+                WatchlistItem.ticker == ticker,
+                WatchlistItem.is_last_trade == True,
+            ],
+            values={'is_last_trade': False},
+        )
+        db.session.commit()
+        assert result == expected
+        last_items = db.session.query(WatchlistItem).filter_by(is_last_trade=True).all()
+        assert all(item.ticker != ticker for item in last_items)
+
+
+class TestDeleteWatchItems:
+
+    def test_deletes_matching_items(self, db, watch_items, db_teardown):
+        # Deletes only the WatchlistItems matching the filters
+        # and returns how many were deleted
+        ticker = random.choice(watch_items).ticker
+        expected = len([item for item in watch_items if item.ticker == ticker])
+        len_items_before = len(watch_items)
+        result = WatchlistItemMgr.delete_items(filters=[
+            WatchlistItem.ticker == ticker
+        ])
+        db.session.commit()
+        assert result == expected
+        remaining = db.session.query(WatchlistItem).all()
+        assert len(remaining) == len_items_before - expected
+        assert all(item.ticker != ticker for item in remaining)
+
+    def test_returns_zero_no_match(self, db, watch_items, db_teardown):
+        # Returns 0 and deletes nothing when no WatchlistItem matches
+        result = WatchlistItemMgr.delete_items(filters=[
+            WatchlistItem.ticker == "Nonexistent Ticker"
+        ])
+        db.session.commit()
+        assert result == 0
+        assert len(db.session.query(WatchlistItem).all()) == len(watch_items)
+
+
 class TestGetPrices:
 
     def test_returns_list_of_prices_with_valid_filters(self, prices, db_teardown):
@@ -677,6 +806,48 @@ class TestGetPrices:
 
 
 
+class TestGetDistinctPrices:
+
+    def test_returns_distinct_tickers(self, prices, db_teardown):
+        # Returns each ticker with prices only once
+        result = PriceMgr.get_distinct_items(
+            filters=[Security.ticker.in_(['AAPL', 'MSFT', 'GOOG'])],
+            entities=[Security.ticker],
+        )
+        assert result.loc[:, 'ticker'].to_list() == ['AAPL', 'MSFT']
+
+
+class TestGetAllSecurities:
+
+    def test_returns_cached_securities(self, db, securities, db_teardown):
+        # Returns all the securities, and keeps returning the same ones
+        # until the cache is cleared
+        SecurityMgr.clear_cache()
+        result = SecurityMgr.get_all_items()
+        assert [item.ticker for item in result] == ['AAPL', 'AMZN', 'MSFT']
+        db.session.add(Security(name="Alphabet Inc.", ticker="GOOG", exchange="NASDAQ"))
+        db.session.commit()
+        assert SecurityMgr.get_all_items() == result
+        SecurityMgr.clear_cache()
+        result = SecurityMgr.get_all_items()
+        assert [item.ticker for item in result] == ['AAPL', 'AMZN', 'GOOG', 'MSFT']
+        SecurityMgr.clear_cache()
+
+    def test_doesnt_cache_empty_securities(self, db, db_teardown):
+        # Doesn't keep an empty listing, so the first loaded securities
+        # are returned without clearing the cache
+        SecurityMgr.clear_cache()
+        db.session.query(Price).delete()
+        db.session.query(Security).delete()
+        db.session.commit()
+        assert SecurityMgr.get_all_items() == []
+        db.session.add(Security(name="Alphabet Inc.", ticker="GOOG", exchange="NASDAQ"))
+        db.session.commit()
+        result = SecurityMgr.get_all_items()
+        assert [item.ticker for item in result] == ['GOOG']
+        SecurityMgr.clear_cache()
+
+
 class TestGetSecurities:
 
     def test_returns_default_filter_by_ticker(self, securities):
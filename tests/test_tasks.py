@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from portfolio_builder import scheduler
+from portfolio_builder.public import tasks
 from portfolio_builder.public.tasks import (
     EXCHANGES, CURRENCIES, COUNTRIES, ASSET_TYPES, 
     get_securities_eodhd
@@ -59,3 +61,57 @@ class TestGetSecuritiesEodhd:
             # The 'isin' column is a string of length 12 
             # if the ticker has an ISIN, or 0 if it doesn't
             assert df['isin'].str.len().isin([12, 0]).all()
+
+
+class TestLoadPricesPendingTickers:
+
+    @pytest.fixture(autouse=True)
+    def paused_scheduler(self, app):
+        # Keep the scheduler from loading the queued tickers on its own
+        scheduler.pause()
+        yield
+        if scheduler.get_job('load_prices_pending_tickers') is not None:
+            scheduler.remove_job('load_prices_pending_tickers')
+        scheduler.resume()
+
+    def test_schedules_single_job(self, app, monkeypatch):
+        # Schedules one job for all the tickers queued before it runs
+        monkeypatch.setattr(tasks, 'pending_tickers', set())
+        tasks.queue_prices_ticker('MSFT')
+        job = scheduler.get_job('load_prices_pending_tickers')
+        tasks.queue_prices_ticker('AAPL')
+        assert scheduler.get_job('load_prices_pending_tickers') is not None
+        assert scheduler.get_job('load_prices_pending_tickers').next_run_time == job.next_run_time
+        assert tasks.pending_tickers == {'AAPL', 'MSFT'}
+
+    def test_loads_queued_tickers_in_one_batch(self, app, monkeypatch):
+        # Loads all the tickers queued since the last run with a single call
+        calls = []
+        monkeypatch.setattr(tasks, 'load_prices_tickers', calls.append)
+        tasks.queue_prices_ticker('MSFT')
+        tasks.queue_prices_ticker('AAPL')
+        tasks.queue_prices_ticker('MSFT')
+        tasks.load_prices_pending_tickers()
+        assert calls == [['AAPL', 'MSFT']]
+
+    def test_does_nothing_without_queued_tickers(self, app, monkeypatch):
+        # Doesn't try to load any prices when no tickers are queued
+        calls = []
+        monkeypatch.setattr(tasks, 'load_prices_tickers', calls.append)
+        tasks.load_prices_pending_tickers()
+        assert calls == []
+
+
+class TestLoadPricesTickers:
+
+    def test_failing_ticker_doesnt_drop_the_others(self, db, monkeypatch):
+        # Loads the valid tickers even if another ticker
+        # of the same batch makes the price request fail
+        loaded = []
+        def load_prices(tickers, start_date, end_date):
+            if 'INVALID' in tickers:
+                raise ValueError("Invalid ticker")
+            loaded.extend(tickers)
+        monkeypatch.setattr(tasks, 'load_prices', load_prices)
+        tasks.load_prices_tickers(['AAPL', 'INVALID', 'MSFT'])
+        assert loaded == ['AAPL', 'MSFT']
@@ -2,6 +2,7 @@ import datetime as dt
 
 import pytest
 from portfolio_builder.auth.models import User
+from portfolio_builder.public.forms import AddWatchlistForm, get_default_date
 from portfolio_builder.public.models import (
     Watchlist, WatchlistItem, Security,
     WatchlistItemMgr
@@ -22,6 +23,145 @@ def all_tickers(db):
     db.session.commit()
 
 
+class TestIndex:
+    @pytest.fixture(scope='function')
+    def loaded_db(self, db):
+        user = db.session.query(User).first()
+        watchlist1 = Watchlist(name="Test_Watchlist", user_id=user.id)
+        watchlist2 = Watchlist(name="Other_Watchlist", user_id=user.id)
+        db.session.add_all([watchlist1, watchlist2])
+        db.session.commit()
+        item = WatchlistItem(
+            ticker='AAPL',
+            quantity=10,
+            price=175.0,
+            side='buy',
+            trade_date=dt.date.today(),
+            watchlist_id=watchlist2.id,
+        )
+        db.session.add(item)
+        db.session.commit()
+        yield
+        db.session.query(WatchlistItem).delete()
+        db.session.query(Watchlist).delete()
+        db.session.commit()
+
+    @pytest.mark.usefixtures("login_required")
+    def test_index_default_watchlist(self, client, loaded_db):
+        response = client.get('/watchlist/')
+        assert response.status_code == 200
+        assert b'Test_Watchlist' in response.data
+        assert b'AAPL' not in response.data
+
+    @pytest.mark.usefixtures("login_required")
+    def test_index_without_watchlists(self, client, db):
+        response = client.get('/watchlist/')
+        assert response.status_code == 200
+        assert b'You do not have any active watchlists' in response.data
+        assert b'Create Watchlist' in response.data
+
+    @pytest.mark.usefixtures("login_required")
+    def test_index_select_watchlist(self, client, loaded_db):
+        response = client.post('/watchlist/', data={
+            'name': 'Other_Watchlist',
+        })
+        assert response.status_code == 200
+        assert b'<span class="watchlist-name-title">Other_Watchlist</span>' in response.data
+        assert b'AAPL' in response.data
+
+    @pytest.mark.usefixtures("login_required")
+    def test_index_select_nonexistent_watchlist(self, client, loaded_db):
+        response = client.post('/watchlist/', data={
+            'name': 'Non_existing_watchlist',
+        })
+        assert response.status_code == 200
+        assert b'<span class="watchlist-name-title">Test_Watchlist</span>' in response.data
+        assert b"doesn&#39;t exist" in response.data
+        assert b"Not a valid choice" not in response.data
+
+
+class TestWatchlists:
+    @pytest.fixture(scope='function')
+    def loaded_db(self, db):
+        user = db.session.query(User).first()
+        watchlist = Watchlist(name="Test_Watchlist", user_id=user.id)
+        db.session.add(watchlist)
+        db.session.commit()
+        yield
+        db.session.query(Watchlist).delete()
+        db.session.commit()
+
+    @pytest.mark.usefixtures("login_required")
+    def test_add_watchlist(self, client, db, loaded_db):
+        watch_name = 'New_Watchlist'
+        response = client.post('/watchlist/add_watchlist', data={
+            'name': watch_name,
+        })
+        assert response.status_code == 302
+        assert response.headers['Location'] == '/watchlist/'
+        assert db.session.query(Watchlist).filter_by(name=watch_name).count() == 1
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert watch_name in messages[0]
+            assert "has been added" in messages[0]
+
+    @pytest.mark.usefixtures("login_required")
+    def test_add_existing_watchlist(self, client, db, loaded_db):
+        watch_name = 'Test_Watchlist'
+        response = client.post('/watchlist/add_watchlist', data={
+            'name': watch_name,
+        })
+        assert response.status_code == 302
+        assert db.session.query(Watchlist).filter_by(name=watch_name).count() == 1
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert "already exists" in messages[0]
+
+    @pytest.mark.usefixtures("login_required")
+    def test_add_existing_watchlist_after_validation(
+        self, client, db, loaded_db, monkeypatch
+    ):
+        # Another request adds the same watchlist after the validation passed
+        monkeypatch.setattr(
+            AddWatchlistForm, 'validate_name', lambda self, name: None
+        )
+        watch_name = 'Test_Watchlist'
+        response = client.post('/watchlist/add_watchlist', data={
+            'name': watch_name,
+        })
+        assert response.status_code == 302
+        assert db.session.query(Watchlist).filter_by(name=watch_name).count() == 1
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert len(messages) == 1
+            assert "already exists" in messages[0]
+
+    @pytest.mark.usefixtures("login_required")
+    def test_delete_watchlist(self, client, db, loaded_db):
+        watch_name = 'Test_Watchlist'
+        response = client.post('/watchlist/delete_watchlist', data={
+            'name': watch_name,
+        })
+        assert response.status_code == 302
+        assert db.session.query(Watchlist).filter_by(name=watch_name).count() == 0
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert watch_name in messages[0]
+            assert "has been deleted" in messages[0]
+
+    @pytest.mark.usefixtures("login_required")
+    def test_delete_nonexistent_watchlist(self, client, db, loaded_db):
+        response = client.post('/watchlist/delete_watchlist', data={
+            'name': 'Non_existing_watchlist',
+        })
+        assert response.status_code == 302
+        assert db.session.query(Watchlist).filter_by(name='Test_Watchlist').count() == 1
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert len(messages) == 1
+            assert "doesn't exist" in messages[0]
+
+
 class TestAdd:
     @pytest.fixture(scope='function')
     def loaded_db(self, db):
@@ -81,6 +221,89 @@ class TestAdd:
             assert "does not exist" in messages[0]
 
 
+class TestUpdate:
+    @pytest.fixture(scope='function')
+    def loaded_db(self, db):
+        user = db.session.query(User).first()
+        watchlist = Watchlist(name="Test_Watchlist", user_id=user.id)
+        db.session.add(watchlist)
+        db.session.commit()
+        item = WatchlistItem(
+            ticker='AAPL',
+            quantity=10,
+            price=175.0,
+            side='buy',
+            trade_date=get_default_date() - dt.timedelta(days=7),
+            watchlist_id=watchlist.id,
+        )
+        db.session.add(item)
+        db.session.commit()
+        yield
+        db.session.query(WatchlistItem).delete()
+        db.session.query(Watchlist).delete()
+        db.session.commit()
+
+    @pytest.mark.usefixtures("login_required")
+    def test_update_item(self, client, loaded_db, all_tickers):
+        # Supersedes the last trade of a ticker with a new one
+        ticker = 'AAPL'
+        watch_name = 'Test_Watchlist'
+        response = client.post(
+            f'/watchlist/{watch_name}/{ticker}/update',
+            data={
+                'watchlist': watch_name,
+                'ticker': ticker,
+                'quantity': 5,
+                'price': 180.0,
+                'side': 'buy',
+                'trade_date': get_default_date(),
+                'comments': '',
+            },
+        )
+        assert response.status_code == 302
+        df_items = WatchlistItemMgr.get_items(
+            filters=[
+                Watchlist.user_id==1,
+                Watchlist.name==watch_name,
+                WatchlistItem.ticker==ticker,
+            ],
+            entities=[WatchlistItem.quantity, WatchlistItem.is_last_trade],
+        )
+        assert len(df_items) == 2
+        assert df_items.loc[:, 'is_last_trade'].to_list() == [False, True]
+        assert df_items.loc[:, 'quantity'].to_list() == [10, 5]
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert ticker in messages[0]
+            assert "has been updated" in messages[0]
+
+    @pytest.mark.usefixtures("login_required")
+    def test_update_nonexistent_item(self, client, loaded_db, all_tickers):
+        ticker = 'MSFT'
+        watch_name = 'Test_Watchlist'
+        response = client.post(
+            f'/watchlist/{watch_name}/{ticker}/update',
+            data={
+                'watchlist': watch_name,
+                'ticker': ticker,
+                'quantity': 5,
+                'price': 330.0,
+                'side': 'buy',
+                'trade_date': get_default_date(),
+                'comments': '',
+            },
+        )
+        assert response.status_code == 302
+        assert len(WatchlistItemMgr.get_items(filters=[
+            Watchlist.user_id==1,
+            Watchlist.name==watch_name,
+            WatchlistItem.ticker==ticker])
+        ) == 0
+        with client.session_transaction() as session:
+            messages = _get_messages(session)
+            assert "There are no items" in messages[0]
+
+
 class TestDelete:
     @pytest.fixture(scope='function')
     def loaded_db(self, db):
@@ -140,6 +363,7 @@ class TestDelete:
             messages = _get_messages(session)
             assert ticker in messages[0]
             assert 'have been deleted' in messages[0]
+            assert '(1 in total)' in messages[0]
 
 
     @pytest.mark.usefixtures("login_required")